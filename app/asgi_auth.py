@@ -0,0 +1,129 @@
+"""
+Bearer token authentication as a pure ASGI middleware.
+Rejects unauthenticated requests before they reach FastAPI routing.
+"""
+
+from typing import Any, Dict, Tuple
+
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.auth import is_admin_key, is_valid_api_key
+
+# Auth schemes are case-insensitive (RFC 7235), so compare lowercased
+_BEARER_PREFIX = b"bearer "
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+# OpenAPI security scheme describing the bearer token the middleware checks
+BEARER_SCHEME_NAME = "Bearer Token"
+_BEARER_SECURITY_SCHEME = {
+    "type": "http",
+    "scheme": "bearer",
+    "description": "API key for authentication",
+}
+
+
+def _unauthorized(detail: str) -> ORJSONResponse:
+    """Build a 401 response asking the client for a bearer token."""
+    return ORJSONResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        content={"detail": detail},
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def add_bearer_security(
+    schema: Dict[str, Any], prefixes: Tuple[str, ...]
+) -> None:
+    """
+    Declare bearer authentication in an OpenAPI schema.
+
+    The middleware enforces auth outside FastAPI's dependency system, so
+    the generated schema does not know about it. This registers the
+    security scheme and marks every operation under prefixes as requiring
+    it, which gives the interactive docs their Authorize button.
+
+    Args:
+        schema: OpenAPI schema to update in place
+        prefixes: Path prefixes whose operations require a bearer token
+    """
+    components = schema.setdefault("components", {})
+    components.setdefault("securitySchemes", {})[BEARER_SCHEME_NAME] = (
+        _BEARER_SECURITY_SCHEME
+    )
+
+    for path, operations in schema.get("paths", {}).items():
+        if path.startswith(prefixes):
+            for operation in operations.values():
+                operation["security"] = [{BEARER_SCHEME_NAME: []}]
+
+
+class BearerAuthMiddleware:
+    """
+    Require a valid API key on protected paths.
+
+    Requests whose path starts with one of protected_prefixes must carry
+    a configured API key. Paths under admin_prefixes require the admin
+    API key instead. All other paths pass through untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        protected_prefixes: Tuple[str, ...] = ("/v1/",),
+        admin_prefixes: Tuple[str, ...] = ("/admin/",),
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            protected_prefixes: Path prefixes requiring an API key
+            admin_prefixes: Path prefixes requiring the admin API key
+        """
+        self.app = app
+        self.protected_prefixes = protected_prefixes
+        self.admin_prefixes = admin_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        admin_only = path.startswith(self.admin_prefixes)
+        if not admin_only and not path.startswith(self.protected_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        # ASGI servers deliver header names lowercased as raw bytes
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                break
+        else:
+            value = b""
+
+        if value[:_BEARER_PREFIX_LEN].lower() != _BEARER_PREFIX:
+            response = _unauthorized("Not authenticated")
+            await response(scope, receive, send)
+            return
+
+        token = value[_BEARER_PREFIX_LEN:]
+        if not token:
+            response = _unauthorized("Missing API key")
+        elif admin_only:
+            if is_admin_key(token):
+                await self.app(scope, receive, send)
+                return
+            response = ORJSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={"detail": "Admin access required"},
+            )
+        elif is_valid_api_key(token.decode("latin-1")):
+            await self.app(scope, receive, send)
+            return
+        else:
+            response = _unauthorized("Invalid API key")
+
+        await response(scope, receive, send)
@@ -1,85 +1,74 @@
 """
 API key authentication for the LLM inference server.
-Implements HTTPBearer security scheme with API key validation.
+Validates bearer tokens against the configured API keys and admin key.
 """
 
-from fastapi import HTTPException, Security, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+import hmac
+import time
+from collections import OrderedDict
 
 from app.config import settings
 
-# HTTPBearer security scheme
-security = HTTPBearer(
-    scheme_name="Bearer Token",
-    description="API key for authentication"
-)
+# Recently validated API keys mapped to their expiry (time.monotonic())
+_TOKEN_CACHE_TTL = 30.0
+_TOKEN_CACHE_MAX = 1024
+_token_cache: "OrderedDict[str, float]" = OrderedDict()
 
 
-async def verify_api_key(
-    credentials: HTTPAuthorizationCredentials = Security(security)
-) -> str:
+def clear_token_cache() -> None:
     """
-    Validate API key from Authorization header.
+    Invalidate all cached API key validations.
+
+    Settings are loaded once per process, so the configured keys cannot
+    change today. This is the hook for a future key-rotation path, which
+    must call it so revoked keys stop being accepted immediately.
+    """
+    _token_cache.clear()
+
+
+def is_valid_api_key(token: str) -> bool:
+    """
+    Check whether a bearer token is a configured API key.
 
     Args:
-        credentials: HTTP Bearer token credentials from request header
+        token: Bearer token from the Authorization header
 
     Returns:
-        The validated API key
-
-    Raises:
-        HTTPException: 401 if API key is invalid
+        True if the token is a valid API key, False otherwise
     """
-    token = credentials.credentials
+    now = time.monotonic()
+    expiry = _token_cache.get(token)
+    if expiry is not None and expiry > now:
+        _token_cache.move_to_end(token)
+        return True
 
-    if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing API key",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    if token not in settings.api_keys_set:
+        return False
 
-    if token not in settings.api_keys:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid API key",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    # Remember the validated key, evicting the least recently used entry
+    _token_cache[token] = now + _TOKEN_CACHE_TTL
+    _token_cache.move_to_end(token)
+    if len(_token_cache) > _TOKEN_CACHE_MAX:
+        _token_cache.popitem(last=False)
 
-    return token
+    return True
 
 
-async def verify_admin_key(
-    credentials: HTTPAuthorizationCredentials = Security(security)
-) -> str:
+def is_admin_key(token: bytes) -> bool:
     """
-    Validate admin API key from Authorization header.
+    Check whether a bearer token is the admin API key.
 
     Admin key is required for management endpoints like model reloading
-    and server information.
+    and server information. The comparison is constant-time for tokens
+    of the right length.
 
     Args:
-        credentials: HTTP Bearer token credentials from request header
+        token: Raw bearer token bytes from the Authorization header
 
     Returns:
-        The validated admin API key
-
-    Raises:
-        HTTPException: 401 if key is missing, 403 if key is invalid
+        True if the token matches the admin API key, False otherwise
     """
-    token = credentials.credentials
-
-    if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing API key",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    if token != settings.admin_api_key:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required",
-        )
-
-    return token
+    admin_key = settings.admin_api_key_bytes
+    return len(token) == len(admin_key) and hmac.compare_digest(
+        token, admin_key
+    )
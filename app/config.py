@@ -3,8 +3,10 @@ Configuration management using Pydantic Settings.
 Loads configuration from environment variables and .env file.
 """
 
+import warnings
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List
+from typing import FrozenSet, List
 
 from pydantic import Field, computed_field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -94,6 +96,21 @@ class Settings(BaseSettings):
             return []
         return [key.strip() for key in self.api_keys_str.split(",") if key.strip()]
 
+    @cached_property
+    def api_keys_set(self) -> FrozenSet[str]:
+        """API keys as a frozenset for constant-time membership checks."""
+        return frozenset(self.api_keys)
+
+    @cached_property
+    def admin_api_key_bytes(self) -> bytes:
+        """Admin API key encoded once for hmac.compare_digest."""
+        return self.admin_api_key.encode("utf-8")
+
+    @cached_property
+    def model_path_str(self) -> str:
+        """Model path as a string for API responses."""
+        return str(self.model_path)
+
     @field_validator("model_path", mode="before")
     @classmethod
     def parse_model_path(cls, v):
@@ -116,14 +133,30 @@ class Settings(BaseSettings):
             )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Load and validate settings once, caching the instance.
+
+    Validation failures only warn, so that scripts and tests can import
+    the package without a full configuration.
+
+    Returns:
+        The shared Settings instance
+    """
+    settings = Settings()
+
+    try:
+        settings.validate_required_fields()
+    except ValueError as e:
+        warnings.warn(f"Configuration validation failed: {e}")
+
+    # Compute derived values up front so request handlers only read them
+    for name in ("api_keys_set", "admin_api_key_bytes", "model_path_str"):
+        getattr(settings, name)
+
+    return settings
+
+
 # Global settings instance
-settings = Settings()
-
-# Validate required fields on import
-try:
-    settings.validate_required_fields()
-except ValueError as e:
-    # Allow import to succeed but log warning
-    # This allows scripts and tests to import without full config
-    import warnings
-    warnings.warn(f"Configuration validation failed: {e}")
+settings = get_settings()
@@ -3,16 +3,64 @@ LLM model manager with CUDA support.
 Handles model loading, inference, and thread-safe access.
 """
 
+from __future__ import annotations
+
 import asyncio
+import functools
 import logging
-from typing import Optional
-
-from llama_cpp import Llama
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from app.config import settings
 
+if TYPE_CHECKING:
+    # Imported lazily in _load_model_sync: the C extension is large and
+    # processes that never load the model should not pay for it
+    from llama_cpp import Llama
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of queued chat requests handed to one executor job
+_CHAT_BATCH_SIZE = 8
+
+# A queued chat request: create_chat_completion kwargs and the caller's future
+_ChatItem = Tuple[dict, "asyncio.Future[dict]"]
+
+
+def _resolve_chat_future(
+    future: "asyncio.Future[dict]",
+    response: Optional[dict],
+    error: Optional[Exception],
+) -> None:
+    """
+    Hand a chat completion result to its caller, if still waiting.
+
+    Args:
+        future: The caller's future
+        response: Completion returned by llama.cpp, if it succeeded
+        error: Exception raised by llama.cpp, if it failed
+    """
+    if future.done():
+        return
+    if error is None:
+        future.set_result(response)
+    else:
+        logger.error("Chat completion failed: %s", error)
+        future.set_exception(RuntimeError(f"Chat completion failed: {error}"))
+
+
+def _fail_chat_futures(items: List[_ChatItem], message: str) -> None:
+    """
+    Fail the futures of chat requests that will not be served.
+
+    Args:
+        items: Chat requests to fail
+        message: Error message for each caller
+    """
+    for _, future in items:
+        if not future.done():
+            future.set_exception(RuntimeError(message))
+
 
 class LLMManager:
     """
@@ -23,13 +71,42 @@ class LLMManager:
     def __init__(self):
         """Initialize the LLM manager."""
         self._llm: Optional[Llama] = None
-        self._lock = asyncio.Lock()
-        self._loading = False
+        # Set whenever no load is in flight; waiters block on it while loading
+        self._ready = asyncio.Event()
+        self._ready.set()
+        self._load_started = False
+        # Serializes admin reloads; created on first use inside the loop
+        self._lock: Optional[asyncio.Lock] = None
+        # Blocking llama.cpp calls run here to keep the event loop free.
+        # A single worker serializes access since a Llama instance is not
+        # thread-safe.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="llm"
+        )
+        # Pending chat requests, drained in batches by a single worker task
+        self._chat_queue: Optional[asyncio.Queue] = None
+        self._chat_worker: Optional[asyncio.Task] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """
+        Get the reload lock, creating it on first use.
+
+        Returns:
+            The manager's reload lock
+        """
+        lock = self._lock
+        if lock is None:
+            lock = self._lock = asyncio.Lock()
+        return lock
 
     async def get_llm(self) -> Llama:
         """
         Get or initialize the LLM instance.
-        Uses double-check locking pattern for thread-safe lazy initialization.
+
+        Once loaded, the model is returned without awaiting. Otherwise the
+        first caller loads it while concurrent callers wait on the ready
+        event. The flag check and flip happen without an intervening await,
+        so no lock is needed to elect the loader on the event loop.
 
         Returns:
             Initialized Llama instance
@@ -37,15 +114,55 @@ class LLMManager:
         Raises:
             RuntimeError: If model fails to load
         """
-        if self._llm is None:
-            async with self._lock:
-                if self._llm is None:  # Double-check locking
-                    logger.info("Loading LLM model...")
-                    self._llm = await self._load_model()
-                    logger.info("LLM model loaded successfully")
+        llm = self._llm
+        if llm is not None:
+            return llm
+
+        while self._llm is None:
+            if self._load_started:
+                # Another caller is loading; retry if its load fails
+                await self._ready.wait()
+                continue
+
+            logger.info("Loading LLM model...")
+            await self._load_and_publish()
+            logger.info("LLM model loaded successfully")
+
         return self._llm
 
+    async def _load_and_publish(self) -> None:
+        """
+        Load the model, replacing any existing instance.
+        Waiters on the ready event are released whether or not loading
+        succeeds.
+
+        Raises:
+            RuntimeError: If model fails to load
+        """
+        self._load_started = True
+        self._ready.clear()
+        try:
+            # Drop the existing model before loading its replacement
+            self._llm = None
+            self._llm = await self._load_model()
+        finally:
+            self._load_started = False
+            self._ready.set()
+
     async def _load_model(self) -> Llama:
+        """
+        Load the LLM model on the worker thread.
+
+        Returns:
+            Initialized Llama instance
+
+        Raises:
+            RuntimeError: If model file not found or loading fails
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._load_model_sync)
+
+    def _load_model_sync(self) -> Llama:
         """
         Load the LLM model with CUDA configuration.
 
@@ -65,9 +182,11 @@ class LLMManager:
                     f"Please download a GGUF model to the models directory."
                 )
 
-            logger.info(f"Loading model from: {model_path}")
-            logger.info(f"GPU layers: {settings.n_gpu_layers}")
-            logger.info(f"Context size: {settings.n_ctx}")
+            logger.info("Loading model from: %s", model_path)
+            logger.info("GPU layers: %s", settings.n_gpu_layers)
+            logger.info("Context size: %s", settings.n_ctx)
+
+            from llama_cpp import Llama
 
             # Load model with configuration
             llm = Llama(
@@ -86,7 +205,7 @@ class LLMManager:
             return llm
 
         except Exception as e:
-            logger.error(f"Failed to load model: {e}")
+            logger.error("Failed to load model: %s", e)
             raise RuntimeError(f"Failed to load model: {e}")
 
     async def reload_model(self) -> None:
@@ -97,17 +216,23 @@ class LLMManager:
         Raises:
             RuntimeError: If model reload fails
         """
-        async with self._lock:
+        async with self._get_lock():
+            # Let an in-flight initial load finish before replacing it
+            while self._load_started:
+                await self._ready.wait()
+
             logger.info("Reloading model...")
+            await self._load_and_publish()
+            logger.info("Model reloaded successfully")
 
-            # Clean up existing model
-            if self._llm is not None:
-                del self._llm
-                self._llm = None
+    def llm_sync(self) -> Optional[Llama]:
+        """
+        Get the LLM instance if it is already loaded, without awaiting.
 
-            # Load new model
-            self._llm = await self._load_model()
-            logger.info("Model reloaded successfully")
+        Returns:
+            Loaded Llama instance, or None if not loaded yet
+        """
+        return self._llm
 
     def is_loaded(self) -> bool:
         """
@@ -142,23 +267,31 @@ class LLMManager:
         Raises:
             RuntimeError: If generation fails
         """
-        llm = await self.get_llm()
+        # Steady state needs no await; load lazily only on first use
+        llm = self.llm_sync()
+        if llm is None:
+            llm = await self.get_llm()
 
         try:
             # Generate completion
-            response = llm(
-                prompt,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                top_p=top_p,
-                stop=stop,
-                echo=False,
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(
+                self._executor,
+                functools.partial(
+                    llm,
+                    prompt,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    top_p=top_p,
+                    stop=stop,
+                    echo=False,
+                ),
             )
 
             return response
 
         except Exception as e:
-            logger.error(f"Generation failed: {e}")
+            logger.error("Generation failed: %s", e)
             raise RuntimeError(f"Generation failed: {e}")
 
     async def create_chat_completion(
@@ -172,6 +305,8 @@ class LLMManager:
         """
         Generate a chat completion for the given messages.
 
+        Requests are queued and served in arrival order by the chat worker.
+
         Args:
             messages: List of message dictionaries with 'role' and 'content'
             max_tokens: Maximum tokens to generate
@@ -185,23 +320,152 @@ class LLMManager:
         Raises:
             RuntimeError: If generation fails
         """
-        llm = await self.get_llm()
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict] = loop.create_future()
+        params = {
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": top_p,
+            "stop": stop,
+        }
+        self.start_chat_worker().put_nowait((params, future))
+        return await future
+
+    def start_chat_worker(self) -> asyncio.Queue:
+        """
+        Start the chat worker task on the running loop if needed.
 
-        try:
-            # Use llama-cpp-python's chat completion format
-            response = llm.create_chat_completion(
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                top_p=top_p,
-                stop=stop,
+        A worker left on another (e.g. closed) event loop is replaced
+        along with its queue.
+
+        Returns:
+            The queue feeding the running chat worker
+        """
+        loop = asyncio.get_running_loop()
+        worker = self._chat_worker
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            self._chat_queue = asyncio.Queue()
+            self._chat_worker = loop.create_task(
+                self._run_chat_worker(self._chat_queue)
             )
+        return self._chat_queue
 
-            return response
+    async def stop_chat_worker(self) -> None:
+        """
+        Cancel the chat worker task, if running.
+
+        Requests the worker had taken or that are still queued fail with
+        a RuntimeError so their callers do not wait forever.
+        """
+        worker = self._chat_worker
+        queue = self._chat_queue
+        self._chat_worker = None
+        self._chat_queue = None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+        if queue is not None:
+            pending = []
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+            _fail_chat_futures(pending, "Chat worker stopped")
+
+    async def _run_chat_worker(self, queue: asyncio.Queue) -> None:
+        """
+        Serve queued chat requests until cancelled.
+
+        Waits for one request, then takes up to _CHAT_BATCH_SIZE - 1 more
+        that are already queued and runs them in a single executor job.
+
+        Args:
+            queue: Queue of pending chat requests
+        """
+        batch: List[_ChatItem] = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < _CHAT_BATCH_SIZE:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                await self._serve_chat_batch(batch)
+
+                # Hold nothing while idle: a reload must be able to free
+                # the old model before it loads the new one
+                batch = []
+        except asyncio.CancelledError:
+            _fail_chat_futures(batch, "Chat worker stopped")
+            raise
+
+    async def _serve_chat_batch(self, batch: List[_ChatItem]) -> None:
+        """
+        Run one batch of chat requests on the LLM worker thread.
+
+        Args:
+            batch: Chat requests taken from the queue
+        """
+        # Skip requests whose callers have gone away (e.g. disconnected)
+        batch = [item for item in batch if not item[1].done()]
+        if not batch:
+            return
+
+        # Steady state needs no await; load lazily only on first use
+        llm = self.llm_sync()
+        if llm is None:
+            try:
+                llm = await self.get_llm()
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._executor,
+            functools.partial(self._run_chat_batch, loop, llm, batch),
+        )
+
+    @staticmethod
+    def _run_chat_batch(
+        loop: asyncio.AbstractEventLoop, llm: Llama, batch: List[_ChatItem]
+    ) -> None:
+        """
+        Run a batch of chat completions on the LLM worker thread.
+
+        Each caller's future is resolved on the event loop as soon as its
+        own completion finishes, not when the whole batch is done.
+
+        Args:
+            loop: Event loop owning the callers' futures
+            llm: Loaded Llama instance
+            batch: Queued chat requests
+        """
+        for params, future in batch:
+            # Racy read from this thread, but a stale answer only means one
+            # wasted generation for a caller that has gone away
+            if future.done():
+                continue
+            try:
+                # Use llama-cpp-python's chat completion format
+                response, error = llm.create_chat_completion(**params), None
+            except Exception as e:
+                response, error = None, e
+            try:
+                loop.call_soon_threadsafe(
+                    _resolve_chat_future, future, response, error
+                )
+            except RuntimeError:
+                # The event loop has closed; no caller is left to answer
+                return
 
-        except Exception as e:
-            logger.error(f"Chat completion failed: {e}")
-            raise RuntimeError(f"Chat completion failed: {e}")
 
 
 # Global LLM manager instance
@@ -5,11 +5,16 @@ LLM inference server with OpenAI-compatible API.
 
 import logging
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
-from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.types import Receive, Scope, Send
 
+from app.asgi_auth import BearerAuthMiddleware, add_bearer_security
 from app.config import settings
 from app.llm import llm_manager
 from app.routes import admin, chat, health
@@ -22,6 +27,27 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class FastCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware that forwards non-CORS requests without inspecting them.
+
+    Requests without an Origin header (health probes, server-side API
+    clients) skip building Starlette's Headers object; everything else is
+    handled by CORSMiddleware as usual.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, _ in scope["headers"]:
+                if name == b"origin":
+                    break
+            else:
+                await self.app(scope, receive, send)
+                return
+
+        await super().__call__(scope, receive, send)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -30,8 +56,8 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info("Starting LLM inference server...")
-    logger.info(f"Model: {settings.model_name}")
-    logger.info(f"Port: {settings.port}")
+    logger.info("Model: %s", settings.model_name)
+    logger.info("Port: %s", settings.port)
 
     try:
         # Preload model on startup
@@ -39,13 +65,16 @@ async def lifespan(app: FastAPI):
         await llm_manager.get_llm()
         logger.info("Model loaded successfully")
     except Exception as e:
-        logger.warning(f"Failed to preload model: {e}")
+        logger.warning("Failed to preload model: %s", e)
         logger.warning("Model will be loaded on first request")
 
+    llm_manager.start_chat_worker()
+
     yield
 
     # Shutdown
     logger.info("Shutting down LLM inference server...")
+    await llm_manager.stop_chat_worker()
 
 
 # Create FastAPI application
@@ -56,12 +85,29 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 
+# Require API keys on /v1/* and the admin key on /admin/*. Added first so
+# it sits innermost and CORS preflight requests never reach it.
+_PROTECTED_PREFIXES = ("/v1/",)
+_ADMIN_PREFIXES = ("/admin/",)
+app.add_middleware(
+    BearerAuthMiddleware,
+    protected_prefixes=_PROTECTED_PREFIXES,
+    admin_prefixes=_ADMIN_PREFIXES,
+)
+
+
+# Compress larger responses (e.g. chat completions); level 5 balances
+# CPU cost against compression ratio
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
 # Add CORS middleware
 app.add_middleware(
-    CORSMiddleware,
+    FastCORSMiddleware,
     allow_origins=["*"],  # Configure based on your needs
     allow_credentials=True,
     allow_methods=["*"],
@@ -75,8 +121,8 @@ async def global_exception_handler(request: Request, exc: Exception):
     """
     Handle uncaught exceptions globally.
     """
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Internal server error",
@@ -91,15 +137,36 @@ app.include_router(chat.router)
 app.include_router(admin.router)
 
 
-@app.get("/")
-async def root():
+def custom_openapi():
     """
-    Root endpoint with API information.
+    Build the OpenAPI schema once, adding what route introspection misses.
+
+    Declares the middleware's bearer auth and the components referenced by
+    the hand-written chat request body schema.
     """
-    return {
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        add_bearer_security(schema, _PROTECTED_PREFIXES + _ADMIN_PREFIXES)
+
+        # The chat request body is documented by hand (the handler reads the
+        # raw body), so register the models it references ourselves
+        components = schema.setdefault("components", {})
+        schemas = components.setdefault("schemas", {})
+        for name, definition in chat.request_body_schema_defs.items():
+            schemas.setdefault(name, definition)
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi
+
+
+@lru_cache(maxsize=1)
+def _root_body(model_name: str) -> bytes:
+    """Encode the root endpoint payload for the given model name."""
+    return orjson.dumps({
         "name": "Remote LLM Inference Server",
         "version": "0.1.0",
-        "model": settings.model_name,
+        "model": model_name,
         "status": "running",
         "docs": "/docs",
         "endpoints": {
@@ -109,10 +176,23 @@ async def root():
             "admin_info": "GET /admin/info",
             "admin_reload": "POST /admin/reload"
         }
-    }
+    })
+
+
+@app.get("/")
+async def root():
+    """
+    Root endpoint with API information.
+    """
+    return Response(
+        content=_root_body(settings.model_name),
+        media_type="application/json"
+    )
 
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
 
     uvicorn.run(
@@ -120,4 +200,8 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         log_level=settings.log_level,
+        # uvloop is not available on Windows; fall back to stock asyncio
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=1,
     )
@@ -2,7 +2,9 @@
 Pydantic models for OpenAI-compatible API requests and responses.
 """
 
-from typing import List, Literal, Optional
+from typing import Annotated, List, Literal, Optional, TypedDict
+
+import msgspec
 from pydantic import BaseModel, Field
 
 
@@ -55,6 +57,30 @@ class ChatCompletionRequest(BaseModel):
     )
 
 
+# Request decoding structs (msgspec)
+#
+# The chat endpoint decodes request bodies with these in a single pass
+# instead of FastAPI's JSON -> dict -> Pydantic pipeline. They mirror
+# Message and ChatCompletionRequest above, which still document the
+# request body in the OpenAPI schema.
+
+class ChatMessage(TypedDict):
+    """Chat message decoded as a plain dict, ready for llama-cpp-python."""
+    role: Literal["system", "user", "assistant"]
+    content: str
+
+
+class ChatCompletionRequestStruct(msgspec.Struct):
+    """Fast-path decoding target for chat completion requests."""
+    messages: List[ChatMessage]
+    model: str = "llama-3-8b"
+    temperature: Annotated[float, msgspec.Meta(ge=0.0, le=2.0)] = 0.7
+    max_tokens: Annotated[int, msgspec.Meta(ge=1, le=32000)] = 500
+    top_p: Annotated[float, msgspec.Meta(ge=0.0, le=1.0)] = 1.0
+    stream: bool = False
+    stop: Optional[List[str]] = None
+
+
 # Response Models
 
 class Usage(BaseModel):
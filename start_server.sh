@@ -53,4 +53,4 @@ echo "Server will be available at: http://0.0.0.0:${PORT:-1133}"
 echo "Press Ctrl+C to stop"
 echo ""
 
-uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-1133}
+uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-1133} --loop uvloop --http httptools
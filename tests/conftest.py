@@ -0,0 +1,88 @@
+"""
+Shared fixtures for the test suite.
+Imports the app once and owns the mock settings, auth headers and request
+bodies used by every test module.
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.config import settings
+from app.llm import llm_manager
+from app.main import app as _app
+
+
+# Mock settings for testing
+MOCK_API_KEYS = ["sk-test-key-123", "sk-test-key-456"]
+MOCK_ADMIN_KEY = "sk-admin-test-key"
+
+# Authorization headers, built once and shared by every request
+AUTH_USER_HEADERS = {"Authorization": f"Bearer {MOCK_API_KEYS[0]}"}
+AUTH_ADMIN_HEADERS = {"Authorization": f"Bearer {MOCK_ADMIN_KEY}"}
+AUTH_BAD_HEADERS = {"Authorization": "Bearer invalid-key"}
+AUTH_HEADERS_BY_KEY = {
+    key: {"Authorization": f"Bearer {key}"} for key in MOCK_API_KEYS
+}
+JSON_HEADERS = {"Content-Type": "application/json"}
+AUTH_USER_JSON_HEADERS = {**AUTH_USER_HEADERS, **JSON_HEADERS}
+
+# Minimal valid chat request body, serialized once
+CHAT_HELLO_BODY = (
+    b'{"model": "test-model", '
+    b'"messages": [{"role": "user", "content": "Hello"}]}'
+)
+
+# Every app module shares the one settings object, so overriding its
+# attributes (including the cached derived values) is enough
+MOCK_SETTINGS = SimpleNamespace(
+    api_keys_str=",".join(MOCK_API_KEYS),
+    api_keys_set=frozenset(MOCK_API_KEYS),
+    admin_api_key=MOCK_ADMIN_KEY,
+    admin_api_key_bytes=MOCK_ADMIN_KEY.encode("utf-8"),
+    model_name="test-model",
+    model_path=Path("/app/models/test.gguf"),
+    model_path_str="/app/models/test.gguf",
+    n_ctx=4096,
+    n_gpu_layers=-1,
+)
+
+
+# One client for the whole run; fixtures only swap the settings under it.
+# ASGITransport calls the app directly on the session event loop and never
+# runs its lifespan, so tests never preload a model.
+_CLIENT = httpx.AsyncClient(
+    transport=httpx.ASGITransport(app=_app), base_url="http://test"
+)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The application under test, imported once by this module."""
+    return _app
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prime_openapi(app):
+    """Build the OpenAPI schema once and serve the cached copy all session."""
+    app.openapi_schema = app.openapi()
+    yield
+    app.openapi_schema = None
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Create test client with mocked settings, shared by the session."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for name, value in vars(MOCK_SETTINGS).items():
+            monkeypatch.setattr(settings, name, value)
+        async with _CLIENT:
+            # Warm the middleware stack and routing before the first test
+            await _CLIENT.get("/health")
+            yield _CLIENT
+        # Chat requests start the worker on the session loop; stop it
+        # before that loop closes
+        await llm_manager.stop_chat_worker()
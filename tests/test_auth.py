@@ -3,93 +3,81 @@ Tests for API key authentication.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch
 
-from app.main import app
+# The app, client fixture and shared constants live in tests/conftest.py
+from tests.conftest import (
+    AUTH_ADMIN_HEADERS,
+    AUTH_BAD_HEADERS,
+    AUTH_HEADERS_BY_KEY,
+    AUTH_USER_HEADERS,
+    CHAT_HELLO_BODY,
+    JSON_HEADERS,
+    MOCK_API_KEYS,
+)
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-# Mock settings for testing
-MOCK_API_KEYS = ["sk-test-key-123", "sk-test-key-456"]
-MOCK_ADMIN_KEY = "sk-admin-test-key"
 
-
-@pytest.fixture
-def client():
-    """Create test client."""
-    with patch("app.config.settings") as mock_settings:
-        mock_settings.api_keys = MOCK_API_KEYS
-        mock_settings.admin_api_key = MOCK_ADMIN_KEY
-        mock_settings.model_name = "test-model"
-        yield TestClient(app)
-
-
-def test_health_endpoint_no_auth(client):
+async def test_health_endpoint_no_auth(client):
     """Test that health endpoint doesn't require authentication."""
-    response = client.get("/health")
+    response = await client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "ok"
 
 
-def test_models_endpoint_requires_auth(client):
+async def test_models_endpoint_requires_auth(client):
     """Test that models endpoint requires authentication."""
-    response = client.get("/v1/models")
-    assert response.status_code == 403  # No auth header
+    response = await client.get("/v1/models")
+    assert response.status_code == 401  # No auth header
 
 
-def test_models_endpoint_with_valid_key(client):
+async def test_models_endpoint_with_valid_key(client):
     """Test models endpoint with valid API key."""
-    response = client.get(
+    response = await client.get(
         "/v1/models",
-        headers={"Authorization": f"Bearer {MOCK_API_KEYS[0]}"}
+        headers=AUTH_USER_HEADERS
     )
     assert response.status_code == 200
 
 
-def test_models_endpoint_with_invalid_key(client):
+async def test_models_endpoint_with_invalid_key(client):
     """Test models endpoint with invalid API key."""
-    response = client.get(
+    response = await client.get(
         "/v1/models",
-        headers={"Authorization": "Bearer invalid-key"}
+        headers=AUTH_BAD_HEADERS
     )
     assert response.status_code == 401
 
 
-def test_chat_endpoint_requires_auth(client):
+async def test_chat_endpoint_requires_auth(client):
     """Test that chat endpoint requires authentication."""
-    response = client.post(
+    response = await client.post(
         "/v1/chat/completions",
-        json={
-            "model": "test-model",
-            "messages": [{"role": "user", "content": "Hello"}]
-        }
+        headers=JSON_HEADERS,
+        content=CHAT_HELLO_BODY
     )
-    assert response.status_code == 403
+    assert response.status_code == 401
 
 
-def test_admin_endpoint_requires_admin_key(client):
+@pytest.mark.parametrize(
+    "headers, expected_status",
+    [
+        (AUTH_USER_HEADERS, 403),  # Regular API key
+        (AUTH_ADMIN_HEADERS, 200),  # Admin key
+    ],
+)
+async def test_admin_endpoint_requires_admin_key(client, headers, expected_status):
     """Test that admin endpoints require admin key."""
-    # Try with regular API key
-    response = client.get(
-        "/admin/info",
-        headers={"Authorization": f"Bearer {MOCK_API_KEYS[0]}"}
-    )
-    assert response.status_code == 403
-
-    # Try with admin key
-    response = client.get(
-        "/admin/info",
-        headers={"Authorization": f"Bearer {MOCK_ADMIN_KEY}"}
-    )
-    assert response.status_code == 200
+    response = await client.get("/admin/info", headers=headers)
+    assert response.status_code == expected_status
 
 
-def test_admin_reload_requires_admin_key(client):
+async def test_admin_reload_requires_admin_key(client):
     """Test that model reload requires admin key."""
     # Try with regular API key
-    response = client.post(
+    response = await client.post(
         "/admin/reload",
-        headers={"Authorization": f"Bearer {MOCK_API_KEYS[0]}"}
+        headers=AUTH_USER_HEADERS
     )
     assert response.status_code == 403
 
@@ -97,11 +85,39 @@ def test_admin_reload_requires_admin_key(client):
     # Not testing actual reload here as it requires model
 
 
-def test_multiple_valid_keys(client):
+@pytest.mark.parametrize("key", MOCK_API_KEYS)
+async def test_multiple_valid_keys(client, key):
     """Test that multiple API keys work."""
-    for key in MOCK_API_KEYS:
-        response = client.get(
-            "/v1/models",
-            headers={"Authorization": f"Bearer {key}"}
-        )
-        assert response.status_code == 200
+    response = await client.get(
+        "/v1/models",
+        headers=AUTH_HEADERS_BY_KEY[key]
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("scheme", ["Bearer", "bearer", "BEARER"])
+async def test_bearer_scheme_is_case_insensitive(client, scheme):
+    """Test that the auth scheme name is matched case-insensitively."""
+    response = await client.get(
+        "/v1/models",
+        headers={"Authorization": f"{scheme} {MOCK_API_KEYS[0]}"}
+    )
+    assert response.status_code == 200
+
+
+async def test_empty_bearer_token(client):
+    """Test that a bearer header without a token is rejected."""
+    response = await client.get(
+        "/v1/models",
+        headers={"Authorization": "Bearer "}
+    )
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Missing API key"
+    assert response.headers["www-authenticate"] == "Bearer"
+
+
+async def test_admin_endpoint_requires_auth(client):
+    """Test that admin endpoints reject requests without credentials."""
+    response = await client.get("/admin/info")
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
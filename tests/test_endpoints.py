@@ -2,34 +2,53 @@
 Tests for API endpoints.
 """
 
+import asyncio
+import json
+import re
+import threading
+import time
+import weakref
+
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, AsyncMock
 
-from app.main import app
+from app.llm import llm_manager
+# The app, client fixture and shared constants live in tests/conftest.py
+from tests.conftest import (
+    AUTH_ADMIN_HEADERS,
+    AUTH_USER_HEADERS,
+    AUTH_USER_JSON_HEADERS,
+)
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-# Mock settings for testing
-MOCK_API_KEYS = ["sk-test-key-123"]
-MOCK_ADMIN_KEY = "sk-admin-test-key"
+# Chat request bodies, serialized once
+_MISSING_MESSAGES_BODY = b'{"model": "test-model"}'
+_INVALID_MESSAGE_BODY = (
+    b'{"model": "test-model", "messages": [{"invalid": "format"}]}'
+)
+_BAD_ROLE_BODY = b'{"messages": [{"role": "bot", "content": "Hello"}]}'
+_BAD_CONTENT_BODY = b'{"messages": [{"role": "user", "content": 5}]}'
+_MALFORMED_BODY = b'{"messages": '
+_VALID_CHAT_BODY = (
+    b'{"model": "test-model", '
+    b'"messages": [{"role": "user", "content": "Hello"}], '
+    b'"temperature": 0.7, "max_tokens": 100}'
+)
+_TEMPERATURE_TOO_HIGH_BODY = (
+    b'{"model": "test-model", '
+    b'"messages": [{"role": "user", "content": "Hello"}], '
+    b'"temperature": 3.0}'  # Max is 2.0
+)
+_MAX_TOKENS_ZERO_BODY = (
+    b'{"model": "test-model", '
+    b'"messages": [{"role": "user", "content": "Hello"}], '
+    b'"max_tokens": 0}'  # Min is 1
+)
 
 
-@pytest.fixture
-def client():
-    """Create test client with mocked settings."""
-    with patch("app.config.settings") as mock_settings:
-        mock_settings.api_keys = MOCK_API_KEYS
-        mock_settings.admin_api_key = MOCK_ADMIN_KEY
-        mock_settings.model_name = "test-model"
-        mock_settings.model_path = "/app/models/test.gguf"
-        mock_settings.n_ctx = 4096
-        mock_settings.n_gpu_layers = -1
-        yield TestClient(app)
-
-
-def test_root_endpoint(client):
+async def test_root_endpoint(client):
     """Test root endpoint returns API information."""
-    response = client.get("/")
+    response = await client.get("/")
     assert response.status_code == 200
     data = response.json()
     assert data["name"] == "Remote LLM Inference Server"
@@ -37,20 +56,20 @@ def test_root_endpoint(client):
     assert "endpoints" in data
 
 
-def test_health_endpoint(client):
+async def test_health_endpoint(client):
     """Test health check endpoint."""
-    response = client.get("/health")
+    response = await client.get("/health")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "ok"
     assert "model_loaded" in data
 
 
-def test_models_list_endpoint(client):
+async def test_models_list_endpoint(client):
     """Test models list endpoint."""
-    response = client.get(
+    response = await client.get(
         "/v1/models",
-        headers={"Authorization": f"Bearer {MOCK_API_KEYS[0]}"}
+        headers=AUTH_USER_HEADERS
     )
     assert response.status_code == 200
     data = response.json()
@@ -59,53 +78,296 @@ def test_models_list_endpoint(client):
     assert data["data"][0]["id"] == "test-model"
 
 
-def test_chat_completion_request_validation(client):
+@pytest.mark.parametrize(
+    "body, loc, error_type",
+    [
+        (_MISSING_MESSAGES_BODY, ["body", "messages"], "value_error"),
+        (
+            _INVALID_MESSAGE_BODY,
+            ["body", "messages", 0, "role"],
+            "value_error",
+        ),
+        (_BAD_ROLE_BODY, ["body", "messages", 0, "role"], "value_error"),
+        (
+            _BAD_CONTENT_BODY,
+            ["body", "messages", 0, "content"],
+            "value_error",
+        ),
+        (_MALFORMED_BODY, ["body"], "json_invalid"),
+    ],
+    ids=[
+        "missing_messages",
+        "invalid_message",
+        "bad_role",
+        "bad_content",
+        "malformed",
+    ],
+)
+async def test_chat_completion_request_validation(
+    client, body, loc, error_type
+):
     """Test that chat completion validates request schema."""
-    # Missing required field (messages)
-    response = client.post(
+    response = await client.post(
         "/v1/chat/completions",
-        headers={"Authorization": f"Bearer {MOCK_API_KEYS[0]}"},
-        json={"model": "test-model"}
+        headers=AUTH_USER_JSON_HEADERS,
+        content=body
     )
     assert response.status_code == 422  # Validation error
-
-    # Invalid message format
-    response = client.post(
-        "/v1/chat/completions",
-        headers={"Authorization": f"Bearer {MOCK_API_KEYS[0]}"},
-        json={
-            "model": "test-model",
-            "messages": [{"invalid": "format"}]
-        }
-    )
-    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["loc"] == loc
+    assert error["type"] == error_type
 
 
-def test_chat_completion_valid_request_format(client):
+async def test_chat_completion_valid_request_format(client):
     """Test chat completion with valid request format."""
     # This will fail without a real model, but we can test the format
-    response = client.post(
+    response = await client.post(
         "/v1/chat/completions",
-        headers={"Authorization": f"Bearer {MOCK_API_KEYS[0]}"},
-        json={
-            "model": "test-model",
-            "messages": [
-                {"role": "user", "content": "Hello"}
-            ],
-            "temperature": 0.7,
-            "max_tokens": 100
-        }
+        headers=AUTH_USER_JSON_HEADERS,
+        content=_VALID_CHAT_BODY
     )
     # Will return 500 because model isn't actually loaded
     # But format is correct
     assert response.status_code in [200, 500]
 
 
-def test_admin_info_endpoint(client):
+class StubLlama:
+    """Stands in for llama_cpp.Llama, echoing the last message back."""
+
+    def __init__(self):
+        self.calls = []
+        self.kwargs = []
+
+    def create_chat_completion(self, messages, **kwargs):
+        content = messages[-1]["content"]
+        self.calls.append(content)
+        self.kwargs.append(kwargs)
+        if len(self.calls) == 1:
+            # Hold the worker so concurrent requests queue up behind it
+            time.sleep(0.05)
+        if content == "fail":
+            raise ValueError("stub failure")
+        return {
+            "choices": [{
+                "message": {
+                    "role": "assistant",
+                    "content": f"Echo: {content}",
+                },
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": 3,
+                "completion_tokens": 2,
+                "total_tokens": 5,
+            },
+        }
+
+
+@pytest.fixture
+def stub_llm(monkeypatch):
+    """Serve chat completions from a StubLlama instead of a real model."""
+    stub = StubLlama()
+    monkeypatch.setattr(llm_manager, "_llm", stub)
+    return stub
+
+
+def _chat_body(content):
+    """Encode a single-message chat request."""
+    return json.dumps(
+        {"messages": [{"role": "user", "content": content}]}
+    ).encode()
+
+
+async def _post_chats(client, contents):
+    """Send one chat request per content concurrently, in list order."""
+    return await asyncio.gather(*(
+        client.post(
+            "/v1/chat/completions",
+            headers=AUTH_USER_JSON_HEADERS,
+            content=_chat_body(content)
+        )
+        for content in contents
+    ))
+
+
+async def test_chat_completion_success(client, stub_llm):
+    """Test that a chat completion returns the OpenAI response shape."""
+    response = await client.post(
+        "/v1/chat/completions",
+        headers=AUTH_USER_JSON_HEADERS,
+        content=_VALID_CHAT_BODY
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"].startswith("chatcmpl-")
+    assert data["object"] == "chat.completion"
+    assert isinstance(data["created"], int)
+    assert data["model"] == "test-model"
+    assert data["choices"] == [{
+        "index": 0,
+        "message": {"role": "assistant", "content": "Echo: Hello"},
+        "finish_reason": "stop",
+    }]
+    assert data["usage"] == {
+        "prompt_tokens": 3,
+        "completion_tokens": 2,
+        "total_tokens": 5,
+    }
+
+
+async def test_concurrent_chat_completions(client, stub_llm):
+    """Test that concurrent requests all succeed, served in arrival order."""
+    contents = [f"request {i}" for i in range(12)]
+    responses = await _post_chats(client, contents)
+
+    for content, response in zip(contents, responses):
+        assert response.status_code == 200
+        message = response.json()["choices"][0]["message"]
+        assert message["content"] == f"Echo: {content}"
+    assert stub_llm.calls == contents
+
+
+async def test_chat_completion_failure_is_isolated(client, stub_llm):
+    """Test that one failing request in a batch does not fail the others."""
+    contents = ["first", "second", "fail", "fourth"]
+    responses = await _post_chats(client, contents)
+
+    assert [r.status_code for r in responses] == [200, 200, 500, 200]
+    assert "stub failure" in responses[2].json()["detail"]
+    assert stub_llm.calls == contents
+
+
+class GatedStubLlama(StubLlama):
+    """StubLlama whose calls after the first block until the gate opens."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+
+    def create_chat_completion(self, messages, **kwargs):
+        if self.calls:
+            self.gate.wait(timeout=5)
+        return super().create_chat_completion(messages, **kwargs)
+
+
+async def test_chat_completion_returns_before_batch_finishes(
+    client, monkeypatch
+):
+    """Test that each request is answered as soon as its own item is done."""
+    stub = GatedStubLlama()
+    monkeypatch.setattr(llm_manager, "_llm", stub)
+    tasks = [
+        asyncio.create_task(client.post(
+            "/v1/chat/completions",
+            headers=AUTH_USER_JSON_HEADERS,
+            content=_chat_body(content)
+        ))
+        for content in ["first", "second", "third"]
+    ]
+
+    try:
+        first = await asyncio.wait_for(tasks[0], timeout=2)
+        assert first.status_code == 200
+        assert not any(task.done() for task in tasks[1:])
+    finally:
+        stub.gate.set()
+
+    for response in await asyncio.gather(*tasks[1:]):
+        assert response.status_code == 200
+    assert stub.calls == ["first", "second", "third"]
+
+
+async def test_stop_chat_worker_fails_pending_requests(client, monkeypatch):
+    """Test that stopping the worker fails taken and still-queued requests."""
+    stub = GatedStubLlama()
+    monkeypatch.setattr(llm_manager, "_llm", stub)
+    # One more than a batch, so at least one request is still queued
+    tasks = [
+        asyncio.create_task(llm_manager.create_chat_completion(
+            messages=[{"role": "user", "content": f"request {i}"}]
+        ))
+        for i in range(10)
+    ]
+
+    try:
+        await asyncio.wait_for(tasks[0], timeout=2)
+        await llm_manager.stop_chat_worker()
+        for task in tasks[1:]:
+            with pytest.raises(RuntimeError, match="Chat worker stopped"):
+                await task
+    finally:
+        stub.gate.set()
+
+
+async def test_reload_frees_old_model_before_loading(client, monkeypatch):
+    """Test that reloading drops the old model before building the new one."""
+    stub = StubLlama()
+    old_model = weakref.ref(stub)
+    monkeypatch.setattr(llm_manager, "_llm", stub)
+    del stub
+
+    # Serve a request first so the chat worker has handled the old model
+    response = await client.post(
+        "/v1/chat/completions",
+        headers=AUTH_USER_JSON_HEADERS,
+        content=_chat_body("Hello")
+    )
+    assert response.status_code == 200
+
+    old_model_alive = []
+
+    def load_new_model():
+        old_model_alive.append(old_model() is not None)
+        return StubLlama()
+
+    monkeypatch.setattr(llm_manager, "_load_model_sync", load_new_model)
+    response = await client.post("/admin/reload", headers=AUTH_ADMIN_HEADERS)
+    assert response.status_code == 200
+    assert old_model_alive == [False]
+
+
+async def test_model_load_failure_reaches_all_callers(client, monkeypatch):
+    """Test that a model load failure is reported to every waiting request."""
+    def fail_to_load():
+        time.sleep(0.05)
+        raise RuntimeError("Failed to load model: stub")
+
+    monkeypatch.setattr(llm_manager, "_load_model_sync", fail_to_load)
+    responses = await _post_chats(client, ["a", "b", "c", "d"])
+
+    for response in responses:
+        assert response.status_code == 500
+        assert "Failed to load model: stub" in response.json()["detail"]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"messages": [{"role": "user", "content": "Hello"}], '
+        b'"max_tokens": 100.0}',
+        b'{"messages": [{"role": "user", "content": "Hello"}], '
+        b'"max_tokens": "100"}',
+    ],
+    ids=["integral_float", "numeric_string"],
+)
+async def test_chat_completion_accepts_lax_numbers(client, stub_llm, body):
+    """Test that numbers are coerced like Pydantic's lax mode did."""
+    response = await client.post(
+        "/v1/chat/completions",
+        headers=AUTH_USER_JSON_HEADERS,
+        content=body
+    )
+    assert response.status_code == 200
+    max_tokens = stub_llm.kwargs[0]["max_tokens"]
+    assert max_tokens == 100
+    assert type(max_tokens) is int
+
+
+async def test_admin_info_endpoint(client):
     """Test admin info endpoint."""
-    response = client.get(
+    response = await client.get(
         "/admin/info",
-        headers={"Authorization": f"Bearer {MOCK_ADMIN_KEY}"}
+        headers=AUTH_ADMIN_HEADERS
     )
     assert response.status_code == 200
     data = response.json()
@@ -116,42 +378,61 @@ def test_admin_info_endpoint(client):
     assert "model_loaded" in data
 
 
-def test_request_validation_temperature_range(client):
-    """Test that temperature is validated to be within range."""
-    # Temperature too high
-    response = client.post(
+@pytest.mark.parametrize(
+    "body, field",
+    [
+        (_TEMPERATURE_TOO_HIGH_BODY, "temperature"),
+        (_MAX_TOKENS_ZERO_BODY, "max_tokens"),
+    ],
+    ids=["temperature", "max_tokens"],
+)
+async def test_request_validation_field_bounds(client, body, field):
+    """Test that sampling parameters are validated against their bounds."""
+    response = await client.post(
         "/v1/chat/completions",
-        headers={"Authorization": f"Bearer {MOCK_API_KEYS[0]}"},
-        json={
-            "model": "test-model",
-            "messages": [{"role": "user", "content": "Hello"}],
-            "temperature": 3.0  # Max is 2.0
-        }
+        headers=AUTH_USER_JSON_HEADERS,
+        content=body
     )
     assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", field]
 
 
-def test_request_validation_max_tokens_positive(client):
-    """Test that max_tokens must be positive."""
-    response = client.post(
-        "/v1/chat/completions",
-        headers={"Authorization": f"Bearer {MOCK_API_KEYS[0]}"},
-        json={
-            "model": "test-model",
-            "messages": [{"role": "user", "content": "Hello"}],
-            "max_tokens": 0  # Min is 1
-        }
-    )
-    assert response.status_code == 422
+async def test_openapi_docs_available(app):
+    """Test that OpenAPI documentation is available."""
+    assert isinstance(app.openapi(), dict)
+    assert app.docs_url == "/docs"
+    assert app.redoc_url == "/redoc"
 
 
-def test_openapi_docs_available(client):
-    """Test that OpenAPI documentation is available."""
-    response = client.get("/docs")
-    assert response.status_code == 200
+@pytest.mark.parametrize(
+    "path, method, protected",
+    [
+        ("/v1/models", "get", True),
+        ("/v1/chat/completions", "post", True),
+        ("/admin/info", "get", True),
+        ("/admin/reload", "post", True),
+        ("/health", "get", False),
+    ],
+)
+async def test_openapi_declares_bearer_auth(app, path, method, protected):
+    """Test that OpenAPI marks the middleware-protected routes as secured."""
+    schema = app.openapi()
+    assert schema["components"]["securitySchemes"]["Bearer Token"] == {
+        "type": "http",
+        "scheme": "bearer",
+        "description": "API key for authentication",
+    }
+    security = schema["paths"][path][method].get("security")
+    assert security == ([{"Bearer Token": []}] if protected else None)
 
-    response = client.get("/redoc")
-    assert response.status_code == 200
 
-    response = client.get("/openapi.json")
-    assert response.status_code == 200
+async def test_openapi_chat_request_refs_resolve(app):
+    """Test that every component the chat request body references exists."""
+    schema = app.openapi()
+    body = schema["paths"]["/v1/chat/completions"]["post"]["requestBody"]
+    refs = re.findall(
+        r'"\$ref": "#/components/schemas/([^"]+)"', json.dumps(body)
+    )
+    assert refs
+    for name in refs:
+        assert name in schema["components"]["schemas"]
@@ -0,0 +1,58 @@
+"""
+Tests for the validated API key cache.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app import auth
+from app.config import settings
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the auth module's monotonic clock with a settable one."""
+    fake = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        auth, "time", SimpleNamespace(monotonic=lambda: fake.now)
+    )
+    auth.clear_token_cache()
+    yield fake
+    auth.clear_token_cache()
+
+
+def test_cached_key_expires_after_ttl(monkeypatch, clock):
+    """Test that a cached key is re-checked once its TTL has passed."""
+    monkeypatch.setattr(settings, "api_keys_set", frozenset({"sk-a"}))
+    assert auth.is_valid_api_key("sk-a")
+
+    # Revoke the key: the cached validation still holds until it expires
+    monkeypatch.setattr(settings, "api_keys_set", frozenset())
+    clock.now += auth._TOKEN_CACHE_TTL - 1
+    assert auth.is_valid_api_key("sk-a")
+
+    clock.now += 2
+    assert not auth.is_valid_api_key("sk-a")
+
+
+def test_cache_evicts_least_recently_used_key(monkeypatch, clock):
+    """Test that the cache drops the least recently used key when full."""
+    monkeypatch.setattr(
+        settings, "api_keys_set", frozenset({"sk-a", "sk-b", "sk-c"})
+    )
+    monkeypatch.setattr(auth, "_TOKEN_CACHE_MAX", 2)
+
+    assert auth.is_valid_api_key("sk-a")
+    assert auth.is_valid_api_key("sk-b")
+    assert auth.is_valid_api_key("sk-a")  # sk-b is now least recently used
+    assert auth.is_valid_api_key("sk-c")
+
+    assert list(auth._token_cache) == ["sk-a", "sk-c"]
+
+
+def test_invalid_key_is_not_cached(monkeypatch, clock):
+    """Test that rejected keys never enter the cache."""
+    monkeypatch.setattr(settings, "api_keys_set", frozenset({"sk-a"}))
+    assert not auth.is_valid_api_key("sk-unknown")
+    assert not auth._token_cache